@@ -69,6 +69,7 @@ module.exports = class Exchange {
                 'cancelOrder': true,
                 'createDepositAddress': false,
                 'createOrder': true,
+                'createOrders': 'emulated',
                 'deposit': false,
                 'fetchBalance': true,
                 'fetchClosedOrders': false,
@@ -516,8 +517,17 @@ module.exports = class Exchange {
         throw new NotSupported (this.id + ' fetchBidsAsks not supported yet')
     }
 
-    fetchTickers (symbols = undefined, params = {}) {
-        throw new NotSupported (this.id + ' fetchTickers not supported yet')
+    async fetchTickers (symbols = undefined, params = {}) {
+        if (this.has['fetchTickers'] !== 'emulated')
+            throw new NotSupported (this.id + ' fetchTickers not supported yet')
+        // emulated with one fetchTicker call per symbol
+        await this.loadMarkets ()
+        if (typeof symbols === 'undefined')
+            symbols = this.symbols
+        const result = {}
+        for (const symbol of symbols)
+            result[symbol] = await this.fetchTicker (symbol, params)
+        return result
     }
 
     fetchOrder (id, symbol = undefined, params = {}) {
@@ -802,6 +812,20 @@ module.exports = class Exchange {
         return this.createOrder (symbol, 'market', 'sell', amount, undefined, params)
     }
 
+    async createOrders (orders) {
+        // a failed order is returned in place as its error, the rest are still placed
+        await this.loadMarkets ()
+        const result = []
+        for (const order of orders) {
+            try {
+                result.push (await this.createOrder (order['symbol'], order['type'], order['side'], order['amount'], order['price'], order['params'] || {}))
+            } catch (e) {
+                result.push (e)
+            }
+        }
+        return result
+    }
+
     costToPrecision (symbol, cost) {
         return parseFloat (cost).toFixed (this.markets[symbol].precision.price)
     }
@@ -26,6 +26,7 @@ module.exports = class gdax extends Exchange {
                 'fetchOpenOrders': true,
                 'fetchClosedOrders': true,
                 'fetchMyTrades': true,
+                'fetchTickers': 'emulated',
             },
             'timeframes': {
                 '1m': 60,
@@ -132,52 +133,62 @@ module.exports = class gdax extends Exchange {
                     },
                 },
             },
+            'exceptions': {
+                'Insufficient funds': InsufficientFunds,
+                'Invalid API Key': AuthenticationError,
+            },
+            // keep-alive connection pool of the python async version, passed to aiohttp.TCPConnector
+            'aiohttp_connector_options': {
+                'limit': 64,
+                'limit_per_host': 16,
+                'keepalive_timeout': 75,
+                'ttl_dns_cache': 300,
+            },
         });
     }
 
     async fetchMarkets () {
         let markets = await this.publicGetProducts ();
+        let fees = this.fees['trading'];
         let result = [];
         for (let p = 0; p < markets.length; p++) {
             let market = markets[p];
-            let id = market['id'];
             let base = market['base_currency'];
             let quote = market['quote_currency'];
-            let symbol = base + '/' + quote;
-            let priceLimits = {
-                'min': this.safeFloat (market, 'quote_increment'),
-                'max': undefined,
-            };
-            let precision = {
-                'amount': 8,
-                'price': this.precisionFromString (this.safeString (market, 'quote_increment')),
-            };
-            let taker = this.fees['trading']['taker'];
+            let taker = fees['taker'];
             if ((base === 'ETH') || (base === 'LTC')) {
                 taker = 0.003;
             }
-            let active = market['status'] === 'online';
-            result.push (this.extend (this.fees['trading'], {
-                'id': id,
-                'symbol': symbol,
+            result.push ({
+                'id': market['id'],
+                'symbol': base + '/' + quote,
                 'base': base,
                 'quote': quote,
-                'precision': precision,
+                'precision': {
+                    'amount': 8,
+                    'price': this.precisionFromString (this.safeString (market, 'quote_increment')),
+                },
                 'limits': {
                     'amount': {
                         'min': parseFloat (market['base_min_size']),
                         'max': parseFloat (market['base_max_size']),
                     },
-                    'price': priceLimits,
+                    'price': {
+                        'min': this.safeFloat (market, 'quote_increment'),
+                        'max': undefined,
+                    },
                     'cost': {
                         'min': parseFloat (market['min_market_funds']),
                         'max': parseFloat (market['max_market_funds']),
                     },
                 },
+                'tierBased': fees['tierBased'],
+                'percentage': fees['percentage'],
+                'maker': fees['maker'],
                 'taker': taker,
-                'active': active,
+                'active': market['status'] === 'online',
                 'info': market,
-            }));
+            });
         }
         return result;
     }
@@ -574,20 +585,24 @@ module.exports = class gdax extends Exchange {
 
     handleErrors (code, reason, url, method, headers, body) {
         if (code === 400) {
-            if (body[0] === '{') {
-                let response = JSON.parse (body);
-                let message = response['message'];
-                let error = this.id + ' ' + message;
-                if (message.indexOf ('price too small') >= 0) {
-                    throw new InvalidOrder (error);
-                } else if (message.indexOf ('price too precise') >= 0) {
-                    throw new InvalidOrder (error);
-                } else if (message === 'Insufficient funds') {
-                    throw new InsufficientFunds (error);
-                } else if (message === 'Invalid API Key') {
-                    throw new AuthenticationError (error);
+            if (typeof body !== 'string')
+                body = this.decode (body);
+            if (body.length > 0) {
+                if (body[0] === '{') {
+                    let response = this.unjson (body);
+                    let message = response['message'];
+                    let error = this.id + ' ' + message;
+                    const exceptions = this.exceptions;
+                    if (message in exceptions) {
+                        throw new exceptions[message] (error);
+                    }
+                    if (message.indexOf ('price too small') >= 0) {
+                        throw new InvalidOrder (error);
+                    } else if (message.indexOf ('price too precise') >= 0) {
+                        throw new InvalidOrder (error);
+                    }
+                    throw new ExchangeError (error);
                 }
-                throw new ExchangeError (this.id + ' ' + message);
             }
             throw new ExchangeError (this.id + ' ' + body);
         }
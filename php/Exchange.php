@@ -434,7 +434,7 @@ abstract class Exchange {
     }
 
     public static function iso8601 ($timestamp) {
-        $result = date ('c', (int) round ($timestamp / 1000));
+        $result = date ('c', (int) floor ($timestamp / 1000));
         $msec = (int) $timestamp % 1000;
         return str_replace ('+', sprintf (".%03d+", $msec), $result);
     }
@@ -448,11 +448,11 @@ abstract class Exchange {
     }
 
     public static function Ymd ($timestamp, $infix = ' ') {
-        return gmdate ('Y-m-d', (int) round ($timestamp / 1000));
+        return gmdate ('Y-m-d', (int) floor ($timestamp / 1000));
     }
 
     public static function YmdHMS ($timestamp, $infix = ' ') {
-        return gmdate ('Y-m-d\\' . $infix . 'H:i:s', (int) round ($timestamp / 1000));
+        return gmdate ('Y-m-d\\' . $infix . 'H:i:s', (int) floor ($timestamp / 1000));
     }
 
     public static function binary_concat () {
@@ -475,6 +475,10 @@ abstract class Exchange {
         return json_encode ($data, $flags);
     }
 
+    public static function unjson ($input) {
+        return json_decode ($input, $as_associative_array = true);
+    }
+
     public static function encode ($input) {
         return $input;
     }
@@ -585,6 +589,7 @@ abstract class Exchange {
             'cancelOrder' => $this->hasPrivateAPI,
             'createDepositAddress' => false,
             'createOrder' => $this->hasPrivateAPI,
+            'createOrders' => 'emulated',
             'deposit' => false,
             'fetchBalance' => true,
             'fetchClosedOrders' => false,
@@ -1209,11 +1214,20 @@ abstract class Exchange {
         return $this->fetch_bids_asks ($symbols, $params);
     }
 
-    public function fetch_tickers ($symbols, $params = array ()) { // stub
-        throw new NotSupported ($this->id . ' API does not allow to fetch all tickers at once with a single call to fetch_tickers () for now');
+    public function fetch_tickers ($symbols = null, $params = array ()) {
+        if (!array_key_exists ('fetchTickers', $this->has) || ($this->has['fetchTickers'] !== 'emulated'))
+            throw new NotSupported ($this->id . ' API does not allow to fetch all tickers at once with a single call to fetch_tickers () for now');
+        // emulated with one fetch_ticker call per symbol
+        $this->load_markets ();
+        if ($symbols === null)
+            $symbols = $this->symbols;
+        $result = array ();
+        foreach ($symbols as $symbol)
+            $result[$symbol] = $this->fetch_ticker ($symbol, $params);
+        return $result;
     }
 
-    public function fetchTickers ($symbols, $params = array ()) {
+    public function fetchTickers ($symbols = null, $params = array ()) {
         return $this->fetch_tickers ($symbols, $params);
     }
 
@@ -1366,6 +1380,20 @@ abstract class Exchange {
         return $this->create_order ($symbol, 'market', 'sell', $amount, null, $params);
     }
 
+    public function create_orders ($orders) {
+        // a failed order is returned in place as its exception, the rest are still placed
+        $this->load_markets ();
+        $result = array ();
+        foreach ($orders as $order) {
+            try {
+                $result[] = $this->create_order ($order['symbol'], $order['type'], $order['side'], $order['amount'], static::safe_value ($order, 'price'), static::safe_value ($order, 'params', array ()));
+            } catch (\Exception $e) {
+                $result[] = $e;
+            }
+        }
+        return $result;
+    }
+
     public function createLimitBuyOrder ($symbol, $amount, $price, $params = array ()) {
         return $this->create_limit_buy_order ($symbol, $amount, $price, $params);
     }
@@ -1382,6 +1410,10 @@ abstract class Exchange {
         return $this->create_market_sell_order ($symbol, $amount, $params);
     }
 
+    public function createOrders ($orders) {
+        return $this->create_orders ($orders);
+    }
+
     public function calculate_fee ($symbol, $type, $side, $amount, $price, $takerOrMaker = 'taker', $params = array ()) {
         $market = $this->markets[$symbol];
         $rate = $market[$takerOrMaker];
@@ -21,6 +21,7 @@ class gdax extends Exchange {
                 'fetchOpenOrders' => true,
                 'fetchClosedOrders' => true,
                 'fetchMyTrades' => true,
+                'fetchTickers' => 'emulated',
             ),
             'timeframes' => array (
                 '1m' => 60,
@@ -127,52 +128,62 @@ class gdax extends Exchange {
                     ),
                 ),
             ),
+            'exceptions' => array (
+                'Insufficient funds' => '\\ccxt\\InsufficientFunds',
+                'Invalid API Key' => '\\ccxt\\AuthenticationError',
+            ),
+            // keep-alive connection pool of the python async version, passed to aiohttp.TCPConnector
+            'aiohttp_connector_options' => array (
+                'limit' => 64,
+                'limit_per_host' => 16,
+                'keepalive_timeout' => 75,
+                'ttl_dns_cache' => 300,
+            ),
         ));
     }
 
     public function fetch_markets () {
         $markets = $this->publicGetProducts ();
+        $fees = $this->fees['trading'];
         $result = array ();
         for ($p = 0; $p < count ($markets); $p++) {
             $market = $markets[$p];
-            $id = $market['id'];
             $base = $market['base_currency'];
             $quote = $market['quote_currency'];
-            $symbol = $base . '/' . $quote;
-            $priceLimits = array (
-                'min' => $this->safe_float($market, 'quote_increment'),
-                'max' => null,
-            );
-            $precision = array (
-                'amount' => 8,
-                'price' => $this->precision_from_string($this->safe_string($market, 'quote_increment')),
-            );
-            $taker = $this->fees['trading']['taker'];
+            $taker = $fees['taker'];
             if (($base === 'ETH') || ($base === 'LTC')) {
                 $taker = 0.003;
             }
-            $active = $market['status'] === 'online';
-            $result[] = array_merge ($this->fees['trading'], array (
-                'id' => $id,
-                'symbol' => $symbol,
+            $result[] = array (
+                'id' => $market['id'],
+                'symbol' => $base . '/' . $quote,
                 'base' => $base,
                 'quote' => $quote,
-                'precision' => $precision,
+                'precision' => array (
+                    'amount' => 8,
+                    'price' => $this->precision_from_string($this->safe_string($market, 'quote_increment')),
+                ),
                 'limits' => array (
                     'amount' => array (
                         'min' => floatval ($market['base_min_size']),
                         'max' => floatval ($market['base_max_size']),
                     ),
-                    'price' => $priceLimits,
+                    'price' => array (
+                        'min' => $this->safe_float($market, 'quote_increment'),
+                        'max' => null,
+                    ),
                     'cost' => array (
                         'min' => floatval ($market['min_market_funds']),
                         'max' => floatval ($market['max_market_funds']),
                     ),
                 ),
+                'tierBased' => $fees['tierBased'],
+                'percentage' => $fees['percentage'],
+                'maker' => $fees['maker'],
                 'taker' => $taker,
-                'active' => $active,
+                'active' => $market['status'] === 'online',
                 'info' => $market,
-            ));
+            );
         }
         return $result;
     }
@@ -569,20 +580,24 @@ class gdax extends Exchange {
 
     public function handle_errors ($code, $reason, $url, $method, $headers, $body) {
         if ($code === 400) {
-            if ($body[0] === '{') {
-                $response = json_decode ($body, $as_associative_array = true);
-                $message = $response['message'];
-                $error = $this->id . ' ' . $message;
-                if (mb_strpos ($message, 'price too small') !== false) {
-                    throw new InvalidOrder ($error);
-                } else if (mb_strpos ($message, 'price too precise') !== false) {
-                    throw new InvalidOrder ($error);
-                } else if ($message === 'Insufficient funds') {
-                    throw new InsufficientFunds ($error);
-                } else if ($message === 'Invalid API Key') {
-                    throw new AuthenticationError ($error);
+            if (gettype ($body) != 'string')
+                $body = $this->decode ($body);
+            if (strlen ($body) > 0) {
+                if ($body[0] === '{') {
+                    $response = $this->unjson ($body);
+                    $message = $response['message'];
+                    $error = $this->id . ' ' . $message;
+                    $exceptions = $this->exceptions;
+                    if (is_array ($exceptions) && array_key_exists ($message, $exceptions)) {
+                        throw new $exceptions[$message] ($error);
+                    }
+                    if (mb_strpos ($message, 'price too small') !== false) {
+                        throw new InvalidOrder ($error);
+                    } else if (mb_strpos ($message, 'price too precise') !== false) {
+                        throw new InvalidOrder ($error);
+                    }
+                    throw new ExchangeError ($error);
                 }
-                throw new ExchangeError ($this->id . ' ' . $message);
             }
             throw new ExchangeError ($this->id . ' ' . $body);
         }
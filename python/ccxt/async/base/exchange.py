@@ -41,19 +41,34 @@ __all__ = [
 
 class Exchange(BaseExchange):
 
+    aiohttp_connector_options = {}  # extra aiohttp.TCPConnector arguments, like limit_per_host or keepalive_timeout
+    _markets_loading = None
+    _orders_semaphore = None
+    _tickers_semaphore = None
+
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
             self.asyncio_loop = config['asyncio_loop']
         self.asyncio_loop = self.asyncio_loop or asyncio.get_event_loop()
-        if 'session' not in config:
-            # Create out SSL context object with our CA cert file
-            context = ssl.create_default_context(cafile=certifi.where())
-            # Pass this SSL context to aiohttp and create a TCPConnector
-            connector = aiohttp.TCPConnector(ssl_context=context, loop=self.asyncio_loop)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector)
         super(Exchange, self).__init__(config)
         self.init_rest_rate_limiter()
 
+    def create_session(self):
+        # called by the base __init__ after describe() and the config have set aiohttp_connector_options
+        # Create out SSL context object with our CA cert file
+        context = ssl.create_default_context(cafile=certifi.where())
+        # Pass this SSL context to aiohttp and create a TCPConnector
+        connector = aiohttp.TCPConnector(ssl_context=context, loop=self.asyncio_loop, **self.aiohttp_connector_options)
+        return aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector)
+
+    def __del__(self):
+        pass  # aiohttp closes sessions in a coroutine, call close() instead
+
+    async def close(self):
+        # a session passed in the config belongs to the caller and is left open
+        if self._own_session and not self.session.closed:
+            await self.session.close()
+
     def init_rest_rate_limiter(self):
         self.throttle = throttle(self.extend({
             'loop': self.asyncio_loop,
@@ -130,12 +145,26 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+        # concurrent callers share one in-flight load, a failed one is retried
+        loading = self._markets_loading
+        if loading is None:
+            loading = self.asyncio_loop.create_task(self._load_markets())
+            loading.add_done_callback(self._markets_loaded)
+            self._markets_loading = loading
+        return await asyncio.shield(loading)
+
+    async def _load_markets(self):
         markets = await self.fetch_markets()
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = await self.fetch_currencies()
         return self.set_markets(markets, currencies)
 
+    def _markets_loaded(self, task):
+        self._markets_loading = None
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller was cancelled
+
     async def fetch_markets(self):
         return self.markets
 
@@ -154,6 +183,28 @@ class Exchange(BaseExchange):
             'asks': self.sort_by(self.aggregate(orderbook['asks']), 0),
         })
 
+    async def fetch_tickers(self, symbols=None, params={}):
+        if self.has['fetchTickers'] != 'emulated':
+            return super(Exchange, self).fetch_tickers(symbols, params)
+        # emulated with one fetch_ticker call per symbol, at most
+        # options['maxConcurrentTickers'] of them in flight at once, read on the first call
+        await self.load_markets()
+        if symbols is None:
+            symbols = self.symbols
+        if self._tickers_semaphore is None:
+            self._tickers_semaphore = asyncio.Semaphore(self.safe_integer(self.options, 'maxConcurrentTickers', 5))
+        semaphore = self._tickers_semaphore
+
+        async def fetch(symbol):
+            async with semaphore:
+                return await self.fetch_ticker(symbol, params)
+
+        tickers = await asyncio.gather(*[fetch(symbol) for symbol in symbols], return_exceptions=True)
+        for ticker in tickers:
+            if isinstance(ticker, Exception):
+                raise ticker
+        return dict(zip(symbols, tickers))
+
     async def fetch_full_tickers(self, symbols=None, params={}):
         tickers = await self.fetch_tickers(symbols, params)
         return tickers
@@ -163,3 +214,19 @@ class Exchange(BaseExchange):
             raise ExchangeError(self.id + ' updateOrder() requires enableRateLimit = true')
         await self.cancel_order(id, symbol)
         return await self.create_order(symbol, *args)
+
+    async def create_orders(self, orders):
+        """Submit a batch of orders concurrently, failed ones are returned as exceptions"""
+        await self.load_markets()
+        if self._orders_semaphore is None:
+            # one limit on the requests in flight per instance, the requests
+            # per second are paced by enableRateLimit in fetch2()
+            # options['maxConcurrentOrders'] is read once here, later changes have no effect
+            self._orders_semaphore = asyncio.Semaphore(self.safe_integer(self.options, 'maxConcurrentOrders', 5))
+        semaphore = self._orders_semaphore
+
+        async def create(order):
+            async with semaphore:
+                return await self.create_order(order['symbol'], order['type'], order['side'], order['amount'], self.safe_value(order, 'price'), self.safe_value(order, 'params', {}))
+
+        return await asyncio.gather(*[create(order) for order in orders], return_exceptions=True)
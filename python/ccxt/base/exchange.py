@@ -68,6 +68,14 @@ except NameError:
 
 # -----------------------------------------------------------------------------
 
+# {param} names by path, extracted once per distinct path
+_path_params = {}
+
+# json.dumps() with custom separators builds a new encoder on every call
+_json_encoder = json.JSONEncoder(separators=(',', ':'))
+
+# -----------------------------------------------------------------------------
+
 
 class Exchange(object):
     """Base exchange class"""
@@ -81,6 +89,7 @@ class Exchange(object):
     asyncio_loop = None
     aiohttp_proxy = None
     session = None  # Session ()
+    _own_session = False  # True if the session was created by the exchange, not passed in the config
     userAgent = None
     userAgents = {
         'chrome': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/62.0.3202.94 Safari/537.36',
@@ -150,6 +159,7 @@ class Exchange(object):
         'cancelOrder': hasPrivateAPI,
         'createDepositAddress': False,
         'createOrder': hasPrivateAPI,
+        'createOrders': 'emulated',
         'deposit': False,
         'fetchBalance': True,
         'fetchClosedOrders': False,
@@ -188,6 +198,9 @@ class Exchange(object):
 
         self.userAgent = default_user_agent()
 
+        # keyed HMAC states by (secret, algorithm), copied for every signature
+        self._hmac_states = {}
+
         settings = self.deep_extend(self.describe(), config)
 
         for key in settings:
@@ -217,12 +230,17 @@ class Exchange(object):
             'maxCapacity': 1000,
         }, getattr(self, 'tokenBucket') if hasattr(self, 'tokenBucket') else {})
 
-        self.session = self.session if self.session else Session()
+        if not self.session:
+            self.session = self.create_session()
+            self._own_session = True
 
     def __del__(self):
-        if self.session:
+        if self.session and self._own_session:
             self.session.close()
 
+    def create_session(self):
+        return Session()
+
     def describe(self):
         return {}
 
@@ -554,12 +572,21 @@ class Exchange(object):
 
     @staticmethod
     def extract_params(string):
-        return re.findall(r'{([\w-]+)}', string)
+        names = _path_params.get(string)
+        if names is None:
+            if len(_path_params) >= 1024:
+                _path_params.clear()
+            names = _path_params[string] = tuple(re.findall(r'{([\w-]+)}', string))
+        return list(names)
 
     @staticmethod
     def implode_params(string, params):
-        for key in params:
-            string = string.replace('{' + key + '}', str(params[key]))
+        names = _path_params.get(string)
+        if names is None:
+            names = Exchange.extract_params(string)
+        for name in names:
+            if name in params:
+                string = string.replace('{' + name + '}', str(params[name]))
         return string
 
     @staticmethod
@@ -655,17 +682,17 @@ class Exchange(object):
 
     @staticmethod
     def iso8601(timestamp):
-        utc = datetime.datetime.utcfromtimestamp(int(round(timestamp / 1000)))
-        return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:<03d}".format(int(timestamp) % 1000) + 'Z'
+        utc = datetime.datetime.utcfromtimestamp(int(timestamp) // 1000)
+        return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
 
     @staticmethod
     def Ymd(timestamp):
-        utc_datetime = datetime.datetime.utcfromtimestamp(int(round(timestamp / 1000)))
+        utc_datetime = datetime.datetime.utcfromtimestamp(int(timestamp) // 1000)
         return utc_datetime.strftime('%Y-%m-%d')
 
     @staticmethod
     def YmdHMS(timestamp, infix=' '):
-        utc_datetime = datetime.datetime.utcfromtimestamp(int(round(timestamp / 1000)))
+        utc_datetime = datetime.datetime.utcfromtimestamp(int(timestamp) // 1000)
         return utc_datetime.strftime('%Y-%m-%d' + infix + '%H:%M:%S')
 
     @staticmethod
@@ -682,7 +709,7 @@ class Exchange(object):
         match = re.search(regex, timestamp, re.IGNORECASE)
         yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
         ms = ms or '.000'
-        msint = int(ms[1:])
+        msint = int(ms[1:].ljust(3, '0'))
         sign = sign or ''
         sign = int(sign + '1')
         hours = int(hours or 0) * sign
@@ -702,9 +729,20 @@ class Exchange(object):
             return base64.b64encode(h.digest())
         return h.digest()
 
-    @staticmethod
-    def hmac(request, secret, algorithm=hashlib.sha256, digest='hex'):
-        h = hmac.new(secret, request, algorithm)
+    def hmac(self, request, secret, algorithm=hashlib.sha256, digest='hex'):
+        if isinstance(secret, bytes):
+            # the key schedule runs once per secret, then the state is copied
+            states = self._hmac_states
+            key = (secret, algorithm)
+            state = states.get(key)
+            if state is None:
+                if len(states) >= 16:
+                    states.clear()
+                state = states[key] = hmac.new(secret, None, algorithm)
+            h = state.copy()
+            h.update(request)
+        else:
+            h = hmac.new(secret, request, algorithm)
         if digest == 'hex':
             return h.hexdigest()
         elif digest == 'base64':
@@ -735,8 +773,7 @@ class Exchange(object):
         encodedHeader = Exchange.base64urlencode(header)
         encodedData = Exchange.base64urlencode(Exchange.encode(Exchange.json(request)))
         token = encodedHeader + '.' + encodedData
-        hmac = Exchange.hmac(Exchange.encode(token), Exchange.encode(secret), algorithm, 'binary')
-        signature = Exchange.base64urlencode(hmac)
+        signature = Exchange.base64urlencode(hmac.new(Exchange.encode(secret), Exchange.encode(token), algorithm).digest())
         return token + '.' + signature
 
     @staticmethod
@@ -745,7 +782,7 @@ class Exchange(object):
 
     @staticmethod
     def json(data, params=None):
-        return json.dumps(data, separators=(',', ':'))
+        return _json_encoder.encode(data)
 
     @staticmethod
     def encode(string):
@@ -857,7 +894,16 @@ class Exchange(object):
         raise NotSupported(self.id + ' API does not allow to fetch all prices at once with a single call to fetch_bid_asks() for now')
 
     def fetch_tickers(self, symbols=None, params={}):
-        raise NotSupported(self.id + ' API does not allow to fetch all tickers at once with a single call to fetch_tickers() for now')
+        if self.has['fetchTickers'] != 'emulated':
+            raise NotSupported(self.id + ' API does not allow to fetch all tickers at once with a single call to fetch_tickers() for now')
+        # emulated with one fetch_ticker call per symbol
+        self.load_markets()
+        if symbols is None:
+            symbols = self.symbols
+        result = {}
+        for symbol in symbols:
+            result[symbol] = self.fetch_ticker(symbol, params)
+        return result
 
     def fetch_order_status(self, id, market=None):
         order = self.fetch_order(id)
@@ -1041,5 +1087,16 @@ class Exchange(object):
     def create_market_sell_order(self, symbol, amount, params={}):
         return self.create_order(symbol, 'market', 'sell', amount, None, params)
 
+    def create_orders(self, orders):
+        """Submit a batch of orders one by one, failed ones are returned as exceptions"""
+        self.load_markets()
+        result = []
+        for order in orders:
+            try:
+                result.append(self.create_order(order['symbol'], order['type'], order['side'], order['amount'], self.safe_value(order, 'price'), self.safe_value(order, 'params', {})))
+            except Exception as e:
+                result.append(e)
+        return result
+
     def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
         raise NotImplemented(self.id + ' sign() pure method must be redefined in derived classes')
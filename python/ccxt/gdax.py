@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 
 from ccxt.base.exchange import Exchange
+
+# -----------------------------------------------------------------------------
+
+try:
+    basestring  # Python 3
+except NameError:
+    basestring = str  # Python 2
 import base64
 import hashlib
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import NotSupported
 from ccxt.base.errors import AuthenticationError
@@ -30,6 +36,7 @@ class gdax (Exchange):
                 'fetchOpenOrders': True,
                 'fetchClosedOrders': True,
                 'fetchMyTrades': True,
+                'fetchTickers': 'emulated',
             },
             'timeframes': {
                 '1m': 60,
@@ -136,50 +143,60 @@ class gdax (Exchange):
                     },
                 },
             },
+            'exceptions': {
+                'Insufficient funds': InsufficientFunds,
+                'Invalid API Key': AuthenticationError,
+            },
+            # keep-alive connection pool of the python async version, passed to aiohttp.TCPConnector
+            'aiohttp_connector_options': {
+                'limit': 64,
+                'limit_per_host': 16,
+                'keepalive_timeout': 75,
+                'ttl_dns_cache': 300,
+            },
         })
 
     def fetch_markets(self):
         markets = self.publicGetProducts()
+        fees = self.fees['trading']
         result = []
         for p in range(0, len(markets)):
             market = markets[p]
-            id = market['id']
             base = market['base_currency']
             quote = market['quote_currency']
-            symbol = base + '/' + quote
-            priceLimits = {
-                'min': self.safe_float(market, 'quote_increment'),
-                'max': None,
-            }
-            precision = {
-                'amount': 8,
-                'price': self.precision_from_string(self.safe_string(market, 'quote_increment')),
-            }
-            taker = self.fees['trading']['taker']
+            taker = fees['taker']
             if (base == 'ETH') or (base == 'LTC'):
                 taker = 0.003
-            active = market['status'] == 'online'
-            result.append(self.extend(self.fees['trading'], {
-                'id': id,
-                'symbol': symbol,
+            result.append({
+                'id': market['id'],
+                'symbol': base + '/' + quote,
                 'base': base,
                 'quote': quote,
-                'precision': precision,
+                'precision': {
+                    'amount': 8,
+                    'price': self.precision_from_string(self.safe_string(market, 'quote_increment')),
+                },
                 'limits': {
                     'amount': {
                         'min': float(market['base_min_size']),
                         'max': float(market['base_max_size']),
                     },
-                    'price': priceLimits,
+                    'price': {
+                        'min': self.safe_float(market, 'quote_increment'),
+                        'max': None,
+                    },
                     'cost': {
                         'min': float(market['min_market_funds']),
                         'max': float(market['max_market_funds']),
                     },
                 },
+                'tierBased': fees['tierBased'],
+                'percentage': fees['percentage'],
+                'maker': fees['maker'],
                 'taker': taker,
-                'active': active,
+                'active': market['status'] == 'online',
                 'info': market,
-            }))
+            })
         return result
 
     def fetch_balance(self, params={}):
@@ -535,19 +552,21 @@ class gdax (Exchange):
 
     def handle_errors(self, code, reason, url, method, headers, body):
         if code == 400:
-            if body[0] == '{':
-                response = json.loads(body)
-                message = response['message']
-                error = self.id + ' ' + message
-                if message.find('price too small') >= 0:
-                    raise InvalidOrder(error)
-                elif message.find('price too precise') >= 0:
-                    raise InvalidOrder(error)
-                elif message == 'Insufficient funds':
-                    raise InsufficientFunds(error)
-                elif message == 'Invalid API Key':
-                    raise AuthenticationError(error)
-                raise ExchangeError(self.id + ' ' + message)
+            if not isinstance(body, basestring):
+                body = self.decode(body)
+            if len(body) > 0:
+                if body[0] == '{':
+                    response = self.unjson(body)
+                    message = response['message']
+                    error = self.id + ' ' + message
+                    exceptions = self.exceptions
+                    if message in exceptions:
+                        raise exceptions[message](error)
+                    if message.find('price too small') >= 0:
+                        raise InvalidOrder(error)
+                    elif message.find('price too precise') >= 0:
+                        raise InvalidOrder(error)
+                    raise ExchangeError(error)
             raise ExchangeError(self.id + ' ' + body)
 
     def request(self, path, api='public', method='GET', params={}, headers=None, body=None):
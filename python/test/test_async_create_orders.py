@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import random
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt.async as ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# a batch of orders is submitted concurrently, at most maxConcurrentOrders at once
+
+inflight = []
+peak = []
+
+
+async def create_order(symbol, type, side, amount, price=None, params={}):
+    inflight.append(symbol)
+    peak.append(len(inflight))
+    try:
+        await asyncio.sleep(random.random() * 0.01)
+        if amount < 0:
+            raise ccxt.InvalidOrder('gdax amount must be positive')
+        return {'id': str(amount), 'symbol': symbol, 'type': type, 'side': side, 'price': price, 'params': params}
+    finally:
+        inflight.remove(symbol)
+
+
+async def load_markets(reload=False):
+    return {}
+
+
+async def test():
+    exchange = ccxt.gdax({
+        'options': {'maxConcurrentOrders': 3},
+    })
+    exchange.create_order = create_order
+    exchange.load_markets = load_markets
+    try:
+        orders = [{
+            'symbol': 'BTC/USD',
+            'type': 'limit',
+            'side': 'buy',
+            'amount': i,
+            'price': 10000 + i,
+        } for i in range(0, 20)]
+        orders[7]['amount'] = -1
+        orders[8] = {'symbol': 'BTC/USD', 'type': 'market', 'side': 'sell', 'amount': 8, 'params': {'a': 1}}
+        results = await exchange.create_orders(orders)
+        # results come back in the order of the input, a failed order in its place
+        assert len(results) == len(orders)
+        assert isinstance(results[7], ccxt.InvalidOrder)
+        assert [result['id'] for result in results if isinstance(result, dict)] == [str(i) for i in range(0, 20) if i != 7]
+        assert results[8]['price'] is None
+        assert results[8]['params'] == {'a': 1}
+        # no more than maxConcurrentOrders were in flight at once
+        assert max(peak) == 3
+        assert not inflight
+        # the limit is read once, when the first batch is submitted
+        del peak[:]
+        exchange.options['maxConcurrentOrders'] = 10
+        await exchange.create_orders(orders)
+        assert max(peak) == 3
+    finally:
+        await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(test())
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import random
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt.async as ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# emulated fetch_tickers() requests the tickers concurrently, at most
+# maxConcurrentTickers at once
+
+symbols = ['BTC/USD', 'BTC/EUR', 'ETH/USD', 'ETH/BTC', 'LTC/USD', 'LTC/BTC', 'BCH/USD']
+inflight = []
+peak = []
+
+
+async def fetch_ticker(symbol, params={}):
+    inflight.append(symbol)
+    peak.append(len(inflight))
+    try:
+        await asyncio.sleep(random.random() * 0.01)
+        if symbol == 'BCH/BTC':
+            raise ccxt.ExchangeError('gdax NotFound')
+        return {'symbol': symbol, 'params': params}
+    finally:
+        inflight.remove(symbol)
+
+
+async def load_markets(reload=False):
+    return {}
+
+
+async def test():
+    exchange = ccxt.gdax({
+        'options': {'maxConcurrentTickers': 2},
+    })
+    exchange.fetch_ticker = fetch_ticker
+    exchange.load_markets = load_markets
+    exchange.symbols = symbols
+    try:
+        assert exchange.has['fetchTickers'] == 'emulated'
+        tickers = await exchange.fetch_tickers()
+        assert sorted(tickers.keys()) == sorted(symbols)
+        assert all(tickers[symbol]['symbol'] == symbol for symbol in symbols)
+        assert max(peak) == 2
+        tickers = await exchange.fetch_tickers(['ETH/BTC'], {'a': 1})
+        assert tickers == {'ETH/BTC': {'symbol': 'ETH/BTC', 'params': {'a': 1}}}
+        # a failed ticker fails the call once the others are done
+        try:
+            await exchange.fetch_tickers(['BTC/USD', 'BCH/BTC', 'ETH/USD'])
+            assert False
+        except ccxt.ExchangeError as e:
+            assert str(e) == 'gdax NotFound'
+        assert not inflight
+    finally:
+        await exchange.close()
+    # exchanges without fetchTickers still raise NotSupported
+    exchange = ccxt.Exchange({'id': 'base'})
+    try:
+        try:
+            await exchange.fetch_tickers()
+            assert False
+        except ccxt.NotSupported:
+            pass
+    finally:
+        await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(test())
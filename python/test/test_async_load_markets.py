@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt.async as ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# concurrent load_markets() calls share one request, a failed load is retried
+
+products = [{
+    'id': 'BTC-USD',
+    'base_currency': 'BTC',
+    'quote_currency': 'USD',
+    'quote_increment': '0.01',
+    'base_min_size': '0.01',
+    'base_max_size': '250',
+    'min_market_funds': '10',
+    'max_market_funds': '1000000',
+    'status': 'online',
+}]
+
+requests = []
+
+
+async def public_get_products(params={}):
+    requests.append(params)
+    await asyncio.sleep(0.01)
+    if len(requests) == 1:
+        raise ccxt.ExchangeNotAvailable('gdax products unavailable')
+    return products
+
+
+async def test():
+    exchange = ccxt.gdax()
+    exchange.publicGetProducts = public_get_products
+    try:
+        # the first load fails for every caller waiting on it
+        results = await asyncio.gather(*[exchange.load_markets() for i in range(0, 10)], return_exceptions=True)
+        assert len(requests) == 1
+        assert all(isinstance(result, ccxt.ExchangeNotAvailable) for result in results)
+        assert not exchange.markets
+        # the next callers start a new load and share it
+        results = await asyncio.gather(*[exchange.load_markets() for i in range(0, 10)])
+        assert len(requests) == 2
+        assert all(result is results[0] for result in results)
+        assert list(results[0].keys()) == ['BTC/USD']
+        # loaded markets are returned without a request
+        await exchange.load_markets()
+        assert len(requests) == 2
+        # a reload requests them again
+        await exchange.load_markets(True)
+        assert len(requests) == 3
+    finally:
+        await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(test())
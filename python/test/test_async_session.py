@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import aiohttp  # noqa: E402
+import ccxt.async as ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# the connector is built from the options of describe() and the config
+
+
+async def test():
+    exchange = ccxt.gdax({'aiohttp_connector_options': {'limit': 32}})
+    connector = exchange.session.connector
+    assert connector.limit == 32
+    assert connector.limit_per_host == 16
+    assert exchange.aiohttp_connector_options['keepalive_timeout'] == 75
+    assert ccxt.Exchange.aiohttp_connector_options == {}
+    # close() closes the session the exchange created, more than once is fine
+    await exchange.close()
+    assert exchange.session.closed
+    await exchange.close()
+    # a session passed in the config belongs to the caller and is left open
+    session = aiohttp.ClientSession()
+    try:
+        exchange = ccxt.gdax({'session': session})
+        assert exchange.session is session
+        await exchange.close()
+        assert not session.closed
+    finally:
+        await session.close()
+
+
+asyncio.get_event_loop().run_until_complete(test())
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+exchange = ccxt.gdax()
+
+
+def raised(code, body):
+    try:
+        exchange.handle_errors(code, 'reason', 'https://api.gdax.com/orders', 'POST', None, body)
+    except ccxt.BaseError as e:
+        return type(e), str(e)
+    return None
+
+
+# ------------------------------------------------------------------------------
+# str bodies
+
+assert raised(200, '{"message":"Insufficient funds"}') is None
+assert raised(400, '{"message":"Insufficient funds"}') == (ccxt.InsufficientFunds, 'gdax Insufficient funds')
+assert raised(400, '{"message":"Invalid API Key"}') == (ccxt.AuthenticationError, 'gdax Invalid API Key')
+assert raised(400, '{"message":"price too small"}') == (ccxt.InvalidOrder, 'gdax price too small')
+assert raised(400, '{"message":"price too precise"}') == (ccxt.InvalidOrder, 'gdax price too precise')
+assert raised(400, '{"message":"size is too small"}') == (ccxt.ExchangeError, 'gdax size is too small')
+assert raised(400, '<html>Bad Request</html>') == (ccxt.ExchangeError, 'gdax <html>Bad Request</html>')
+
+# ------------------------------------------------------------------------------
+# bytes bodies are decoded before they are inspected
+
+assert raised(400, b'{"message":"Insufficient funds"}') == (ccxt.InsufficientFunds, 'gdax Insufficient funds')
+assert raised(400, b'{"message":"price too small"}') == (ccxt.InvalidOrder, 'gdax price too small')
+assert raised(400, b'Bad Request') == (ccxt.ExchangeError, 'gdax Bad Request')
+
+# ------------------------------------------------------------------------------
+# an empty body is a generic error, not an IndexError
+
+assert raised(400, '') == (ccxt.ExchangeError, 'gdax ')
+assert raised(400, b'') == (ccxt.ExchangeError, 'gdax ')
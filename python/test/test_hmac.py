@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import hashlib
+import hmac
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# exchange.hmac() reuses a keyed state per secret, it must sign like hmac.new()
+
+secrets = [b'secret', b'another secret', b'x' * 200]
+algorithms = [hashlib.md5, hashlib.sha256, hashlib.sha384, hashlib.sha512]
+requests = [b'', b'1516060800GET/orders', b'1516060800POST/orders{"size":"0.01"}']
+
+base = ccxt.Exchange()
+
+for repeat in range(0, 2):
+    for secret in secrets:
+        for algorithm in algorithms:
+            for request in requests:
+                expected = hmac.new(secret, request, algorithm)
+                assert base.hmac(request, secret, algorithm) == expected.hexdigest()
+                assert base.hmac(request, secret, algorithm, 'base64') == base64.b64encode(expected.digest())
+                assert base.hmac(request, secret, algorithm, 'binary') == expected.digest()
+
+# ------------------------------------------------------------------------------
+# gdax signs nonce + method + path + body with the base64-decoded secret
+
+
+class gdax(ccxt.gdax):
+
+    def nonce(self):
+        return 1516060800
+
+
+exchange = gdax({
+    'apiKey': 'key',
+    'secret': base64.b64encode(b'secret').decode(),
+    'password': 'passphrase',
+})
+
+
+def signature(secret, what):
+    return base64.b64encode(hmac.new(base64.b64decode(secret), what.encode(), hashlib.sha256).digest()).decode()
+
+
+request = exchange.sign('orders/{id}', 'private', 'GET', {'id': '1', 'limit': 1})
+assert request['url'] == 'https://api.gdax.com/orders/1?limit=1'
+assert request['body'] is None
+assert request['headers']['CB-ACCESS-SIGN'] == signature(exchange.secret, '1516060800GET/orders/1?limit=1')
+
+request = exchange.sign('orders', 'private', 'POST', {'size': '0.01'})
+assert request['body'] == '{"size":"0.01"}'
+assert request['headers']['CB-ACCESS-SIGN'] == signature(exchange.secret, '1516060800POST/orders{"size":"0.01"}')
+
+request = exchange.sign('orders/{id}', 'private', 'DELETE', {'id': '1'})
+assert request['headers']['CB-ACCESS-SIGN'] == signature(exchange.secret, '1516060800DELETE/orders/1')
+
+# a changed secret must not reuse the state keyed with the old one
+exchange.secret = base64.b64encode(b'rotated').decode()
+request = exchange.sign('orders', 'private', 'POST', {'size': '0.01'})
+assert request['headers']['CB-ACCESS-SIGN'] == signature(exchange.secret, '1516060800POST/orders{"size":"0.01"}')
+
+# keyed states belong to the instance, secrets are not shared across exchanges
+assert set(key[0] for key in exchange._hmac_states) == set([b'secret', b'rotated'])
+assert b'rotated' not in set(key[0] for key in base._hmac_states)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# only the {param} placeholders of the path are filled in
+
+for repeat in range(0, 2):
+    assert ccxt.Exchange.implode_params('orders/{id}', {'id': 1}) == 'orders/1'
+    assert ccxt.Exchange.implode_params('products/{id}/candles', {'id': 'BTC-USD', 'granularity': 60}) == 'products/BTC-USD/candles'
+    assert ccxt.Exchange.implode_params('{user-id}/orders/{id}', {'user-id': 'u', 'id': 'o'}) == 'u/orders/o'
+    # a missing param leaves its placeholder in place
+    assert ccxt.Exchange.implode_params('orders/{id}', {}) == 'orders/{id}'
+    assert ccxt.Exchange.implode_params('orders/{id}/{type}', {'id': 1}) == 'orders/1/{type}'
+    # keys that are not strings are ignored
+    assert ccxt.Exchange.implode_params('orders/{id}', {'id': 1, 2: 'x'}) == 'orders/1'
+    # paths without placeholders are returned as they are
+    assert ccxt.Exchange.implode_params('orders', {'id': 1}) == 'orders'
+
+assert ccxt.Exchange.extract_params('orders/{id}/{type}') == ['id', 'type']
+assert ccxt.Exchange.extract_params('orders') == []
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# milliseconds are formatted as they are, the seconds are never rounded up
+
+assert ccxt.Exchange.iso8601(1516060800000) == '2018-01-16T00:00:00.000Z'
+assert ccxt.Exchange.iso8601(1516060800578) == '2018-01-16T00:00:00.578Z'
+assert ccxt.Exchange.iso8601(1516060800005) == '2018-01-16T00:00:00.005Z'
+assert ccxt.Exchange.iso8601(1516060859999) == '2018-01-16T00:00:59.999Z'
+
+assert ccxt.Exchange.Ymd(1516147199999) == '2018-01-16'
+assert ccxt.Exchange.YmdHMS(1516060800578) == '2018-01-16 00:00:00'
+assert ccxt.Exchange.YmdHMS(1516060859999, 'T') == '2018-01-16T00:00:59'
+
+# ------------------------------------------------------------------------------
+# fractions shorter than three digits are milliseconds, not raw numbers
+
+assert ccxt.Exchange.parse8601('2018-01-16T00:00:00Z') == 1516060800000
+assert ccxt.Exchange.parse8601('2018-01-16T00:00:00.6Z') == 1516060800600
+assert ccxt.Exchange.parse8601('2018-01-16T00:00:00.06Z') == 1516060800060
+assert ccxt.Exchange.parse8601('2018-01-16T00:00:00.578Z') == 1516060800578
+
+for timestamp in [1516060800000, 1516060800005, 1516060800578, 1516060859999]:
+    assert ccxt.Exchange.parse8601(ccxt.Exchange.iso8601(timestamp)) == timestamp